@@ -16,8 +16,9 @@ design the code within a module in a modular fashion and only "export" what we
 want.
 
 Here, all three functions internally forward parts of their computations
-to the utility functions _round_all() and _scaled_average() that contain all
-the logic common to the three functions.
+to the utility functions _round_all(), _scaled_average(), and
+_scaled_average_by_parity() that contain all the logic common to the three
+functions.
 
 While this example is stylized, it shows how Python modules are often
 designed.
@@ -34,6 +35,22 @@ def _scaled_average(numbers, scalar):
     return scalar * average
 
 
+def _scaled_average_by_parity(numbers, scalar, *, even):
+    """Internal utility function to calculate scaled averages of even/odd numbers.
+
+    The numbers are rounded, filtered, and summed up in a single pass
+    without creating any intermediate lists.
+    """
+    parity = 0 if even else 1
+    total = count = 0
+    for n in numbers:
+        rounded = round(n)
+        if rounded & 1 == parity:  # the last bit is 0 for even numbers
+            total += rounded
+            count += 1
+    return scalar * (total / count)
+
+
 def average(numbers, *, scalar=1):
     """Calculate the average of all numbers in a list.
 
@@ -59,7 +76,7 @@ def average_evens(numbers, *, scalar=1):
     Returns:
         scaled_average (float)
     """
-    return _scaled_average([n for n in _round_all(numbers) if n % 2 == 0], scalar)
+    return _scaled_average_by_parity(numbers, scalar, even=True)
 
 
 def average_odds(numbers, *, scalar=1):
@@ -73,4 +90,4 @@ def average_odds(numbers, *, scalar=1):
     Returns:
         scaled_average (float)
     """
-    return _scaled_average([n for n in _round_all(numbers) if n % 2 != 0], scalar)
+    return _scaled_average_by_parity(numbers, scalar, even=False)
@@ -3,6 +3,10 @@
 This module defines:
 - a generator object `data` modeling an infinite stream of integers
 - a function `make_finite_stream()` that creates finite streams of data
+- a function `make_finite_stream_iter()` that does the same without wrapping
+  the stream in another generator
+- a function `make_finite_batch()` that creates the data of a finite stream
+  all at once as a numpy array
 
 The probability distribution underlying the integers is Gaussian-like with a
 mean of 42 and a standard deviation of 8. The left tail of the distribution is
@@ -10,20 +14,52 @@ cut off meaning that the streams only produce non-negative numbers. Further,
 one in a hundred random numbers has an increased chance to be an outlier.
 """
 
-import itertools as _itertools
-import random as _random
+import numpy as _np
 
 
-_random.seed(87)
+_rng = _np.random.default_rng(87)
 
 
-def _infinite_stream():
-    """Internal generator function to simulate an infinite stream of data."""
+def _fill(gauss, numbers):
+    """Internal utility function to fill `numbers` with random numbers in place.
+
+    `gauss` is a floating-point buffer of the same size used as scratch space.
+    Re-using both buffers avoids allocating new arrays for every batch, except
+    for the small boolean mask flagging the outliers.
+    """
+    _rng.standard_normal(out=gauss)
+    gauss *= 8
+    gauss += 42
+    _np.copyto(numbers, gauss, casting="unsafe")  # truncates toward 0 like int()
+    _np.maximum(numbers, 0, out=numbers)
+    # One in a hundred numbers is doubled: the outliers are flagged by comparing
+    # uniform floats against a threshold, and only they are doubled in place.
+    # As the Gaussian floats are already copied into `numbers`, `gauss` is free
+    # to hold the uniform floats.
+    _rng.random(out=gauss)
+    _np.multiply(numbers, 2, out=numbers, where=gauss < 0.01)
+    return numbers
+
+
+def _draw(size):
+    """Internal utility function to draw `size` random numbers at once."""
+    return _fill(_np.empty(size), _np.empty(size, dtype=_np.int64))
+
+
+def _draw_length(min_, max_):
+    """Internal utility function to draw the length of a finite stream."""
+    return int(_rng.integers(min_, max_, endpoint=True))
+
+
+def _infinite_stream(bufsize=4096):
+    """Internal generator function to simulate an infinite stream of data.
+
+    The random numbers are drawn in batches of `bufsize` numbers at a time,
+    which is a lot faster than drawing them one by one.
+    """
+    gauss, numbers = _np.empty(bufsize), _np.empty(bufsize, dtype=_np.int64)
     while True:
-        number = max(0, int(_random.gauss(42, 8)))
-        if _random.randint(1, 100) == 1:
-            number *= 2
-        yield number
+        yield from _fill(gauss, numbers).tolist()
 
 
 def make_finite_stream(min_=5, max_=15):
@@ -43,9 +79,46 @@ def make_finite_stream(min_=5, max_=15):
     Raises:
         ValueError: if max_ < min_
     """
-    stream = _infinite_stream()
-    n = _random.randint(min_, max_)
-    yield from _itertools.islice(stream, n)
+    # Only as many random numbers as needed are drawn (i.e., not a whole batch
+    # of the infinite stream).
+    n = _draw_length(min_, max_)
+    yield from _draw(n).tolist()
+
+
+def make_finite_stream_iter(min_=5, max_=15):
+    """Simulate a finite stream of data.
+
+    This is an alternative to `make_finite_stream()` for callers that do not
+    need the stream to be a generator: the returned iterator produces the
+    numbers without passing each of them through a generator first.
+
+    Args:
+        min_ (optional, int): minimum numbers in the stream; defaults to 5
+        max_ (optional, int): maximum numbers in the stream; defaults to 15
+
+    Returns:
+        finite_stream (list_iterator)
+
+    Raises:
+        ValueError: if max_ < min_
+    """
+    return iter(_draw(_draw_length(min_, max_)).tolist())
+
+
+def make_finite_batch(min_=5, max_=15):
+    """Simulate the data of a finite stream all at once.
+
+    Args:
+        min_ (optional, int): minimum numbers in the batch; defaults to 5
+        max_ (optional, int): maximum numbers in the batch; defaults to 15
+
+    Returns:
+        finite_batch (numpy.ndarray)
+
+    Raises:
+        ValueError: if max_ < min_
+    """
+    return _draw(_draw_length(min_, max_))
 
 
 data = _infinite_stream()
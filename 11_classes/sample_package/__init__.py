@@ -3,8 +3,8 @@
 The package is split into three modules:
 - matrix: defines the Matrix class
 - vector: defines the Vector class
-- utils: defines the norm() function that is shared by Matrix and Vector
-         and package-wide constants
+- utils: defines the norm() and all_close() functions that are shared by
+         Matrix and Vector, and package-wide constants
 
 The classes implement arithmetic operations involving vectors and matrices.
 
@@ -1,7 +1,10 @@
 """This module defines a Matrix class."""
 
+import functools
 import numbers
 
+import numpy as np
+
 # Note the import at the bottom of this file, and
 # see the comments about imports in the matrix module.
 from sample_package import utils
@@ -11,18 +14,22 @@ class Matrix:
     """An m-by-n-dimensional matrix from linear algebra.
 
     All entries are converted to floats, or whatever is set in the typing attribute.
+    Internally, the entries are stored in one contiguous two-dimensional
+    numpy.ndarray so that the arithmetic is delegated to numpy's compiled routines.
 
     Attributes:
-        storage (callable): data type used to store the entries internally;
-            defaults to tuple
-        typing (callable): type casting applied to all entries upon creation;
-            defaults to float
+        typing (callable): type casting applied to all entries upon creation,
+            passed on to numpy as the dtype; defaults to float
         vector_cls (vector.Vector): a reference to the Vector class to work with
         zero_threshold (float): max. tolerance when comparing an entry to zero;
             defaults to 1e-12
     """
 
-    storage = utils.DEFAULT_ENTRIES_STORAGE
+    # Instances only have the attributes listed here and no .__dict__, which
+    # makes them smaller and attribute access faster. Subclasses should define
+    # `__slots__ = ()` (or list their additional attributes) to keep that.
+    __slots__ = ("_entries", "_n_rows", "_n_cols", "_len")
+
     typing = utils.DEFAULT_ENTRY_TYPE
     # the `vector_cls` attribute is set at the bottom of this file
     zero_threshold = utils.ZERO_THRESHOLD
@@ -37,22 +44,42 @@ class Matrix:
                 of the matrix's columns (i.e., column-major order)
 
         Raises:
+            TypeError: if an entry cannot be type casted (e.g., None)
             ValueError:
                 - if no entries are provided
                 - if the number of columns is inconsistent across the rows
+                - if the entries are not arranged in two dimensions
 
         Example Usage:
             >>> Matrix([(1, 2), (3, 4)])
             Matrix(((1.0, 2.0,), (3.0, 4.0,)))
         """
-        self._entries = self.storage(
-            self.storage(self.typing(x) for x in r) for r in data
-        )
-        for row in self._entries[1:]:
-            if len(row) != self.n_cols:
-                raise ValueError("rows must have the same number of entries")
-        if len(self) == 0:
+        # A numpy.ndarray is copied as a whole.
+        if isinstance(data, np.ndarray):
+            entries = np.array(data)
+        # Otherwise, the rows may be generators, so they are materialized first
+        # to check their lengths before numpy builds the actual array.
+        else:
+            rows = [list(r) for r in data]
+            for row in rows[1:]:
+                if len(row) != len(rows[0]):
+                    raise ValueError("rows must have the same number of entries")
+            entries = np.array(rows)
+        if entries.size == 0:
             raise ValueError("a matrix must have at least one entry")
+        elif entries.ndim != 2:
+            raise ValueError("a matrix must have exactly two dimensions")
+        # numpy is not told the type of the entries right away because it would,
+        # for example, silently cast None into NaN. Instead, numpy falls back to
+        # Python objects for entries that are not numbers (e.g., None or Fraction).
+        # These are type casted one by one, which raises a TypeError for None.
+        if entries.dtype == object:
+            entries = np.array([[self.typing(x) for x in r] for r in entries.tolist()])
+        self._entries = entries.astype(self.typing, copy=False)
+        # As a Matrix is never changed after its creation (i.e., all operations
+        # return new instances), its dimensions are calculated only once.
+        self._n_rows, self._n_cols = self._entries.shape
+        self._len = self._entries.size
 
     @classmethod
     def from_columns(cls, data):
@@ -75,7 +102,12 @@ class Matrix:
             >>> Matrix.from_columns([(1, 2), (3, 4)])
             Matrix(((1.0, 3.0,), (2.0, 4.0,)))
         """
-        return cls(data).transpose()
+        # The columns are type casted and validated as if they were rows. Then,
+        # numpy copies the entries once into row-major order, which makes all
+        # later operations on the Matrix work on contiguous memory. A simple
+        # `cls(data).transpose()` would keep the entries in column-major order.
+        columns = cls(data)
+        return cls._from_raw(np.ascontiguousarray(columns._entries.T))
 
     @classmethod
     def from_rows(cls, data):
@@ -85,11 +117,77 @@ class Matrix:
         # Otherwise, this method is redundant.
         return cls(data)
 
+    @classmethod
+    def _from_raw(cls, entries):
+        """Internal utility method to create a Matrix from a numpy.ndarray.
+
+        Unlike .__init__(), this neither casts nor validates the entries.
+        So, it must only be used with non-empty two-dimensional arrays
+        that are already of the correct type (e.g., results of other operations).
+        """
+        matrix = cls.__new__(cls)
+        matrix._entries = entries
+        matrix._n_rows, matrix._n_cols = entries.shape
+        matrix._len = entries.size
+        return matrix
+
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def identity(cls, n):
+        """Create an n-by-n identity matrix.
+
+        As a Matrix is never changed after its creation, the created instances
+        are cached and shared among all callers asking for the same dimension.
+
+        Args:
+            n (int): number of rows and columns
+
+        Returns:
+            matrix (Matrix)
+
+        Raises:
+            ValueError: if n is not positive
+
+        Example Usage:
+            >>> Matrix.identity(2)
+            Matrix(((1.0, 0.0,), (0.0, 1.0,)))
+        """
+        matrix = cls(np.eye(max(n, 0)))
+        matrix._entries.flags.writeable = False  # protect the shared entries
+        return matrix
+
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def zeros(cls, n_rows, n_cols):
+        """Create an m-by-n matrix with all entries being 0.
+
+        See .identity() for the caching of the created instances.
+
+        Args:
+            n_rows (int): number of rows
+            n_cols (int): number of columns
+
+        Returns:
+            matrix (Matrix)
+
+        Raises:
+            ValueError: if n_rows or n_cols is not positive
+
+        Example Usage:
+            >>> Matrix.zeros(2, 3)
+            Matrix(((0.0, 0.0, 0.0,), (0.0, 0.0, 0.0,)))
+        """
+        matrix = cls([[0] * n_cols] * n_rows)
+        matrix._entries.flags.writeable = False  # protect the shared entries
+        return matrix
+
     def __repr__(self):
         """Text representation of a Matrix."""
         name = self.__class__.__name__
+        # map() calls repr() without an extra generator per row, and str.join()
+        # is given a list as it materializes its argument anyway.
         args = ", ".join(
-            "(" + ", ".join(repr(c) for c in r) + ",)" for r in self._entries
+            ["(" + ", ".join(map(repr, r)) + ",)" for r in self._entries.tolist()]
         )
         return f"{name}(({args}))"
 
@@ -102,16 +200,16 @@ class Matrix:
     @property
     def n_rows(self):
         """Number of rows in a Matrix."""
-        return len(self._entries)
+        return self._n_rows
 
     @property
     def n_cols(self):
         """Number of columns in a Matrix."""
-        return len(self._entries[0])
+        return self._n_cols
 
     def __len__(self):
         """Number of entries in a Matrix."""
-        return self.n_rows * self.n_cols
+        return self._len
 
     def __getitem__(self, index):
         """Obtain an individual entry of a Matrix.
@@ -137,11 +235,11 @@ class Matrix:
         # Sequence-like indexing (one-dimensional)
         if isinstance(index, int):
             if index < 0:
-                index += len(self)
-            if not (0 <= index < len(self)):
+                index += self._len
+            if not (0 <= index < self._len):
                 raise IndexError("integer index out of range")
-            row, col = divmod(index, self.n_cols)
-            return self._entries[row][col]
+            # numpy maps the index onto the (row-major) entries in C.
+            return self._entries.item(index)
         # Mathematical-like indexing (two-dimensional)
         elif (
             isinstance(index, tuple)
@@ -149,7 +247,7 @@ class Matrix:
             and isinstance(index[0], int)
             and isinstance(index[1], int)
         ):
-            return self._entries[index[0]][index[1]]
+            return self._entries.item(index[0], index[1])
         raise TypeError("index must be either an int or a tuple of two int's")
 
     def rows(self):
@@ -158,7 +256,7 @@ class Matrix:
         Returns:
             rows (generator): produces a Matrix's rows as Vectors
         """
-        return (self.vector_cls(r) for r in self._entries)
+        return self._as_vectors(self._entries)
 
     def cols(self):
         """Loop over a Matrix's columns.
@@ -166,10 +264,18 @@ class Matrix:
         Returns:
             columns (generator): produces a Matrix's columns as Vectors
         """
-        return (
-            self.vector_cls(self._entries[r][c] for r in range(self.n_rows))
-            for c in range(self.n_cols)
-        )
+        # The columns are the rows of the transposed array (i.e., a view).
+        return self._as_vectors(self._entries.T)
+
+    def _as_vectors(self, entries):
+        """Internal utility method to turn an array's rows into Vectors."""
+        # The rows are views on the entries, which is safe to share
+        # as neither a Matrix nor a Vector is changed after its creation.
+        return (self._to_vector(r) for r in entries)
+
+    def _to_vector(self, entries):
+        """Internal utility method to turn a one-dimensional array into a Vector."""
+        return self.vector_cls._from_raw(entries)
 
     def entries(self, *, reverse=False, row_major=True):
         """Loop over a Matrix's entries.
@@ -179,16 +285,15 @@ class Matrix:
             row_major (bool): flag to loop in row-major order; defaults to True
 
         Returns:
-            entries (generator): produces a Matrix's entries
+            entries (iterator): produces a Matrix's entries
         """
+        # numpy flattens the entries in either C (i.e., row-major) or Fortran
+        # (i.e., column-major) order, and .tolist() provides them as built-in
+        # floats. That replaces two levels of indexing per entry in Python.
+        entries = self._entries.ravel(order="C" if row_major else "F").tolist()
         if reverse:
-            rows = range(self.n_rows - 1, -1, -1)
-            cols = range(self.n_cols - 1, -1, -1)
-        else:
-            rows, cols = range(self.n_rows), range(self.n_cols)
-        if row_major:
-            return (self._entries[r][c] for r in rows for c in cols)
-        return (self._entries[r][c] for c in cols for r in rows)
+            return reversed(entries)
+        return iter(entries)
 
     def __iter__(self):
         """Loop over a Matrix's entries.
@@ -221,15 +326,21 @@ class Matrix:
         """
         # Matrix addition
         if isinstance(other, self.__class__):
-            if (self.n_rows != other.n_rows) or (self.n_cols != other.n_cols):
+            if self._entries.shape != other._entries.shape:
                 raise ValueError("matrices must have the same dimensions")
-            return self.__class__(
-                (s_col + o_col for (s_col, o_col) in zip(s_row, o_row))
-                for (s_row, o_row) in zip(self._entries, other._entries)
-            )
+            return self._from_raw(self._entries + other._entries)
         # Broadcasting addition
         elif isinstance(other, numbers.Number):
-            return self.__class__((c + other for c in r) for r in self._entries)
+            # The scalar is type casted like the entries. Otherwise, numpy would
+            # change the entries' type (e.g., a Fraction makes them Python objects
+            # and a complex number makes them complex). So, as with .__init__(),
+            # a complex number raises a TypeError.
+            other = self.typing(other)
+            # Adding 0 changes nothing. As a Matrix is never changed after its
+            # creation, it is safe to return self instead of a copy.
+            if other == 0:
+                return self
+            return self._from_raw(self._entries + other)
         return NotImplemented
 
     def __radd__(self, other):
@@ -255,28 +366,41 @@ class Matrix:
             >>> 10 - Matrix([(1, 2), (3, 4)])
             Matrix(((9.0, 8.0,), (7.0, 6.0,)))
         """
-        # As subtraction is the inverse of addition,
-        # we first dispatch to .__neg__() to invert the signs of
-        # all entries in other and then dispatch to .__add__().
-        return self + (-other)
+        # Subtraction could be expressed as `self + (-other)`. However, that
+        # creates a negated copy of other first. So, we subtract directly.
+        # Matrix subtraction
+        if isinstance(other, self.__class__):
+            if self._entries.shape != other._entries.shape:
+                raise ValueError("matrices must have the same dimensions")
+            return self._from_raw(self._entries - other._entries)
+        # Broadcasting subtraction
+        elif isinstance(other, numbers.Number):
+            other = self.typing(other)  # see comments in .__add__()
+            if other == 0:
+                return self
+            return self._from_raw(self._entries - other)
+        return NotImplemented
 
     def __rsub__(self, other):
         """See docstring for .__sub__()."""
         if isinstance(other, self.vector_cls):
             raise TypeError("vectors and matrices cannot be subtracted")
-        # Same comments as in .__sub__() apply
-        # with the roles of self and other swapped.
-        return (-self) + other
+        # Same comments as in .__sub__() apply with the roles of self and other
+        # swapped. Matrix subtraction is always handled by .__sub__().
+        if isinstance(other, numbers.Number):
+            other = self.typing(other)  # see comment in .__add__()
+            return self._from_raw(other - self._entries)
+        return NotImplemented
 
     def _matrix_multiply(self, other):
         """Internal utility method to multiply to Matrix instances."""
-        if self.n_cols != other.n_rows:
+        if self._n_cols != other._n_rows:
             raise ValueError("matrices must have compatible dimensions")
         # Matrix-matrix multiplication means that each entry of the resulting
         # Matrix is the dot product of the respective row of the "left" Matrix
-        # and column of the "right" Matrix. So, the rows/columns are represented
-        # by the Vector instances provided by the .cols() and .rows() methods.
-        return self.__class__((rv * cv for cv in other.cols()) for rv in self.rows())
+        # and column of the "right" Matrix. numpy's @ operator does exactly that
+        # in one (BLAS) call instead of one Python-level dot product per entry.
+        return self._from_raw(self._entries @ other._entries)
 
     def __mul__(self, other):
         """Handle `self * other` and `other * self`.
@@ -304,17 +428,29 @@ class Matrix:
             >>> Vector([5, 6]) * Matrix([(1, 2), (3, 4)])
             Vector((23.0, 34.0))
         """
+        # Matrix-matrix multiplication
+        # This is checked first as the isinstance() check against the abstract
+        # numbers.Number is slower than against a concrete class.
+        if isinstance(other, self.__class__):
+            return self._matrix_multiply(other)
         # Scalar multiplication
-        if isinstance(other, numbers.Number):
-            return self.__class__((x * other for x in r) for r in self._entries)
+        elif isinstance(other, numbers.Number):
+            other = self.typing(other)  # see comment in .__add__()
+            # Multiplying with 1 or 0 does not require any arithmetic.
+            # See also the comment in .__add__().
+            if other == 1:
+                return self
+            elif other == 0:
+                return self.zeros(self._n_rows, self._n_cols)
+            return self._from_raw(self._entries * other)
         # Matrix-vector multiplication: Vector is a column Vector
         elif isinstance(other, self.vector_cls):
-            # First, cast the other Vector as a Matrix, then do matrix-matrix
-            # multiplication, and lastly return the result as a Vector again.
-            return self._matrix_multiply(other.as_matrix()).as_vector()
-        # Matrix-matrix multiplication
-        elif isinstance(other, self.__class__):
-            return self._matrix_multiply(other)
+            if self._n_cols != len(other):
+                raise ValueError("matrices must have compatible dimensions")
+            # Conceptually, the other Vector is cast as a Matrix, then we do
+            # matrix-matrix multiplication, and lastly return the result as a
+            # Vector again. numpy does all of that without the intermediate objects.
+            return self._to_vector(self._entries @ other._entries)
         return NotImplemented
 
     def __rmul__(self, other):
@@ -324,7 +460,9 @@ class Matrix:
             return self * other
         # Vector-matrix multiplication: Vector is a row Vector
         elif isinstance(other, self.vector_cls):
-            return other.as_matrix(column=False)._matrix_multiply(self).as_vector()
+            if len(other) != self._n_rows:
+                raise ValueError("matrices must have compatible dimensions")
+            return self._to_vector(other._entries @ self._entries)
         return NotImplemented
 
     def __truediv__(self, other):
@@ -336,10 +474,17 @@ class Matrix:
             >>> Matrix([(1, 2), (3, 4)]) / 4
             Matrix(((0.25, 0.5,), (0.75, 1.0,)))
         """
-        # As scalar division division is the same as multiplication
-        # with the inverse, we dispatch to .__mul__().
+        # Scalar division could be expressed as multiplication with the
+        # inverse. However, numpy divides all entries in one operation, too, and
+        # without the rounding error of calculating the inverse first.
         if isinstance(other, numbers.Number):
-            return self * (1 / other)
+            other = self.typing(other)  # see comments in .__add__()
+            if other == 1:
+                return self
+            # numpy would only warn and return infinite entries.
+            elif other == 0:
+                raise ZeroDivisionError("division by zero")
+            return self._from_raw(self._entries / other)
         return NotImplemented
 
     def __eq__(self, other):
@@ -355,12 +500,9 @@ class Matrix:
             False
         """
         if isinstance(other, self.__class__):
-            if (self.n_rows != other.n_rows) or (self.n_cols != other.n_cols):
+            if self._entries.shape != other._entries.shape:
                 raise ValueError("matrices must have the same dimensions")
-            for x, y in zip(self, other):
-                if abs(x - y) > self.zero_threshold:
-                    return False  # exit early if two corresponding entries differ
-            return True
+            return utils.all_close(self._entries, other._entries, self.zero_threshold)
         return NotImplemented
 
     def __pos__(self):
@@ -375,7 +517,7 @@ class Matrix:
 
         Negate all entries of a Matrix.
         """
-        return self.__class__((-x for x in r) for r in self._entries)
+        return self._from_raw(-self._entries)
 
     def __abs__(self):
         """The Frobenius norm of a Matrix."""
@@ -413,7 +555,7 @@ class Matrix:
         """
         if not (self.n_rows == 1 or self.n_cols == 1):
             raise RuntimeError("one dimension (m or n) must be 1")
-        return self.vector_cls(x for x in self)
+        return self._to_vector(self._entries.ravel())
 
     def transpose(self):
         """Switch the rows and columns of a Matrix.
@@ -428,7 +570,9 @@ class Matrix:
             >>> m.transpose()
             Matrix(((1.0, 3.0,), (2.0, 4.0,)))
         """
-        return self.__class__(zip(*self._entries))
+        # numpy's .T is a view on the same entries with the strides swapped.
+        # Sharing the entries is safe as a Matrix is never changed after creation.
+        return self._from_raw(self._entries.T)
 
 
 # This import needs to be made here as otherwise an ImportError is raised.
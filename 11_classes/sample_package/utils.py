@@ -2,17 +2,21 @@
 
 The defined constants are used as defaults in the Vector and Matrix classes.
 
-The norm() function is shared by Vector.__abs__() and Matrix.__abs__().
+The norm() function is shared by Vector.__abs__() and Matrix.__abs__(),
+and the all_close() function by Vector.__eq__() and Matrix.__eq__().
 """
 
 import math
 
+import numpy as np
+
 
 # Define constants (i.e., normal variables that are, by convention, named in UPPERCASE)
 # that are used as the defaults for class attributes within Vector and Matrix.
-DEFAULT_ENTRIES_STORAGE = tuple
 DEFAULT_ENTRY_TYPE = float
 ZERO_THRESHOLD = 1e-12
+# The number of entries all_close() compares at once before it may exit early.
+COMPARISON_BLOCK_SIZE = 4096
 
 
 def norm(vec_or_mat):
@@ -31,5 +35,54 @@ def norm(vec_or_mat):
         norm() may be called, for example, with `[3, 4]` as the argument:
         >>> norm([3, 4])
         5.0
+
+        Empty sequences have a norm of 0:
+        >>> norm([])
+        0.0
+    """
+    # Objects keeping their entries in a numpy.ndarray (e.g., Matrix) are
+    # handed to numpy as they are. Other objects are converted first.
+    entries = getattr(vec_or_mat, "_entries", None)
+    if not isinstance(entries, np.ndarray):
+        entries = np.fromiter(vec_or_mat, dtype=np.float64)
+    # The sum of the squared entries is calculated in one (BLAS) call.
+    flat = entries.ravel().astype(np.float64, copy=False)
+    sum_of_squares = np.dot(flat, flat)
+    if np.isfinite(sum_of_squares) and sum_of_squares >= np.finfo(np.float64).tiny:
+        return math.sqrt(sum_of_squares)
+    # Squaring large (small) entries may overflow (underflow). Only then, the
+    # entries are first scaled by the largest absolute entry, as LAPACK's dnrm2 does.
+    # initial=0.0 covers objects without entries (i.e., norm([]) is 0.0).
+    scale = np.abs(entries).max(initial=0.0)
+    if scale == 0 or not np.isfinite(scale):
+        return float(scale)
+    return float(scale * np.linalg.norm(entries / scale))
+
+
+def all_close(entries, other_entries, threshold):
+    """Check if all corresponding entries differ by no more than a threshold.
+
+    The entries are compared block by block with numpy so that the check
+    exits early if two entries in one of the first blocks differ.
+
+    Args:
+        entries (sequence / numpy.ndarray): the entries of a matrix or vector
+        other_entries (sequence / numpy.ndarray): the entries to compare with;
+            must have the same number of entries as `entries`
+        threshold (float): max. tolerance between two corresponding entries
+
+    Returns:
+        all_close (bool)
+
+    Example Usage:
+        >>> all_close([1, 2, 3], [1, 2, 3 + 1e-13], 1e-12)
+        True
+        >>> all_close([1, 2, 3], [1, 2, 4], 1e-12)
+        False
     """
-    return math.sqrt(sum(x ** 2 for x in vec_or_mat))
+    entries, other_entries = np.ravel(entries), np.ravel(other_entries)
+    for start in range(0, entries.size, COMPARISON_BLOCK_SIZE):
+        block = slice(start, start + COMPARISON_BLOCK_SIZE)
+        if not np.all(np.abs(entries[block] - other_entries[block]) <= threshold):
+            return False  # exit early if two corresponding entries differ
+    return True
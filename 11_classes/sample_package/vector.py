@@ -1,11 +1,14 @@
 """This module defines a Vector class."""
 
 # Imports from the standard library go first ...
+import functools
+import math
 import numbers
 
-# ... and are followed by project-internal ones.
-# If third-party libraries are needed, they are
-# put into a group on their own in between.
+# ... followed by third-party libraries in a group on their own ...
+import numpy as np
+
+# ... and then project-internal ones.
 # Within a group, imports are sorted lexicographically.
 from sample_package import matrix
 from sample_package import utils
@@ -15,19 +18,21 @@ class Vector:
     """A one-dimensional vector from linear algebra.
 
     All entries are converted to floats, or whatever is set in the typing attribute.
+    Internally, the entries are stored in one contiguous one-dimensional
+    numpy.ndarray (cf., the Matrix class).
 
     Attributes:
         matrix_cls (matrix.Matrix): a reference to the Matrix class to work with
-        storage (callable): data type used to store the entries internally;
-            defaults to tuple
-        typing (callable): type casting applied to all entries upon creation;
-            defaults to float
+        typing (callable): type casting applied to all entries upon creation,
+            passed on to numpy as the dtype; defaults to float
         zero_threshold (float): max. tolerance when comparing an entry to zero;
             defaults to 1e-12
     """
 
+    # See the comment on __slots__ in the Matrix class.
+    __slots__ = ("_entries",)
+
     matrix_cls = matrix.Matrix
-    storage = utils.DEFAULT_ENTRIES_STORAGE
     typing = utils.DEFAULT_ENTRY_TYPE
     zero_threshold = utils.ZERO_THRESHOLD
 
@@ -38,6 +43,7 @@ class Vector:
             data (sequence): the vector's entries
 
         Raises:
+            TypeError: if an entry cannot be type casted (e.g., None)
             ValueError: if no entries are provided
 
         Example Usage:
@@ -47,14 +53,87 @@ class Vector:
             >>> Vector(range(3))
             Vector((0.0, 1.0, 2.0))
         """
-        self._entries = self.storage(self.typing(x) for x in data)
-        if len(self) == 0:
+        # Other iterables than lists or tuples (e.g., generators) are materialized
+        # so that the entries may be looked at a second time below.
+        if not isinstance(data, (list, tuple)):
+            data = list(data)
+        # numpy type casts the entries in C.
+        self._entries = np.fromiter(data, dtype=self.typing)
+        if self._entries.size == 0:
             raise ValueError("a vector must have at least one entry")
+        # However, numpy silently casts None into NaN. Only if there are NaNs,
+        # the entries are type casted one by one, which raises a TypeError for None.
+        # Any NaN entry makes the sum of the squared entries NaN, and numpy
+        # calculates that one number faster than an array of NaN flags.
+        if math.isnan(self._entries.dot(self._entries)):
+            self._entries = np.array([self.typing(x) for x in data])
+
+    @classmethod
+    def _from_raw(cls, entries):
+        """Internal utility method to create a Vector from a numpy.ndarray.
+
+        Unlike .__init__(), this neither casts nor validates the entries.
+        So, it must only be used with non-empty one-dimensional arrays
+        that are already of the correct type (e.g., results of other operations).
+        """
+        vector = cls.__new__(cls)
+        vector._entries = entries
+        return vector
+
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def zeros(cls, n):
+        """Create a Vector with all entries being 0.
+
+        As a Vector is never changed after its creation, the created instances
+        are cached and shared among all callers asking for the same length.
+
+        Args:
+            n (int): number of entries
+
+        Returns:
+            vector (Vector)
+
+        Raises:
+            ValueError: if n is not positive
+
+        Example Usage:
+            >>> Vector.zeros(3)
+            Vector((0.0, 0.0, 0.0))
+        """
+        vector = cls([0] * n)
+        vector._entries.flags.writeable = False  # protect the shared entries
+        return vector
+
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def ones(cls, n):
+        """Create a Vector with all entries being 1.
+
+        See .zeros() for the caching of the created instances.
+
+        Args:
+            n (int): number of entries
+
+        Returns:
+            vector (Vector)
+
+        Raises:
+            ValueError: if n is not positive
+
+        Example Usage:
+            >>> Vector.ones(3)
+            Vector((1.0, 1.0, 1.0))
+        """
+        vector = cls([1] * n)
+        vector._entries.flags.writeable = False  # protect the shared entries
+        return vector
 
     def __repr__(self):
         """Text representation of a Vector."""
         name = self.__class__.__name__
-        args = ", ".join(repr(x) for x in self)
+        # .tolist() provides the entries as built-in floats and not numpy scalars.
+        args = ", ".join(map(repr, self._entries.tolist()))
         return f"{name}(({args}))"
 
     def __str__(self):
@@ -65,21 +144,21 @@ class Vector:
 
     def __len__(self):
         """Number of entries in a Vector."""
-        return len(self._entries)
+        return self._entries.size
 
     def __getitem__(self, index):
         """Obtain an individual entry of a Vector."""
         if not isinstance(index, int):
             raise TypeError("index must be an integer")
-        return self._entries[index]
+        return self._entries.item(index)
 
     def __iter__(self):
         """Loop over a Vector's entries."""
-        return iter(self._entries)
+        return iter(self._entries.tolist())
 
     def __reversed__(self):
         """Loop over a Vector's entries in reverse order."""
-        return reversed(self._entries)
+        return reversed(self._entries.tolist())
 
     def __add__(self, other):
         """Handle `self + other` and `other + self`.
@@ -100,10 +179,19 @@ class Vector:
         if isinstance(other, self.__class__):
             if len(self) != len(other):
                 raise ValueError("vectors must be of the same length")
-            return self.__class__(x + y for (x, y) in zip(self, other))
+            return self._from_raw(self._entries + other._entries)
         # Broadcasting addition
         elif isinstance(other, numbers.Number):
-            return self.__class__(x + other for x in self)
+            # The scalar is type casted like the entries. Otherwise, numpy would
+            # change the entries' type (e.g., a Fraction makes them Python objects
+            # and a complex number makes them complex). So, as with .__init__(),
+            # a complex number raises a TypeError.
+            other = self.typing(other)
+            # Adding 0 changes nothing. As a Vector is never changed after its
+            # creation, it is safe to return self instead of a copy.
+            if other == 0:
+                return self
+            return self._from_raw(self._entries + other)
         return NotImplemented
 
     def __radd__(self, other):
@@ -127,16 +215,29 @@ class Vector:
             >>> 10 - Vector([1, 2, 3])
             Vector((9.0, 8.0, 7.0))
         """
-        # As subtraction is the inverse of addition,
-        # we first dispatch to .__neg__() to invert the signs of
-        # all entries in other and then dispatch to .__add__().
-        return self + (-other)
+        # Subtraction could be expressed as `self + (-other)`. However, that
+        # creates a negated copy of other first. So, we subtract directly.
+        # Vector subtraction
+        if isinstance(other, self.__class__):
+            if len(self) != len(other):
+                raise ValueError("vectors must be of the same length")
+            return self._from_raw(self._entries - other._entries)
+        # Broadcasting subtraction
+        elif isinstance(other, numbers.Number):
+            other = self.typing(other)  # see comments in .__add__()
+            if other == 0:
+                return self
+            return self._from_raw(self._entries - other)
+        return NotImplemented
 
     def __rsub__(self, other):
         """See docstring for .__sub__()."""
-        # Same comments as in .__sub__() apply
-        # with the roles of self and other swapped.
-        return (-self) + other
+        # Same comments as in .__sub__() apply with the roles of self and other
+        # swapped. Vector subtraction is always handled by .__sub__().
+        if isinstance(other, numbers.Number):
+            other = self.typing(other)  # see comment in .__add__()
+            return self._from_raw(other - self._entries)
+        return NotImplemented
 
     def __mul__(self, other):
         """Handle `self * other` and `other * self`.
@@ -157,10 +258,18 @@ class Vector:
         if isinstance(other, self.__class__):
             if len(self) != len(other):
                 raise ValueError("vectors must be of the same length")
-            return sum(x * y for (x, y) in zip(self, other))
+            # numpy calculates the dot product in one (BLAS) call.
+            return float(np.dot(self._entries, other._entries))
         # Scalar multiplication
         elif isinstance(other, numbers.Number):
-            return self.__class__(x * other for x in self)
+            other = self.typing(other)  # see comment in .__add__()
+            # Multiplying with 1 or 0 does not require any arithmetic.
+            # See also the comment in .__add__().
+            if other == 1:
+                return self
+            elif other == 0:
+                return self.zeros(len(self))
+            return self._from_raw(self._entries * other)
         return NotImplemented
 
     def __rmul__(self, other):
@@ -178,10 +287,17 @@ class Vector:
             >>> Vector([9, 6, 12]) / 3
             Vector((3.0, 2.0, 4.0))
         """
-        # As scalar division division is the same as multiplication
-        # with the inverse, we dispatch to .__mul__().
+        # Scalar division could be expressed as multiplication with the
+        # inverse. However, numpy divides all entries in one operation, too, and
+        # without the rounding error of calculating the inverse first.
         if isinstance(other, numbers.Number):
-            return self * (1 / other)
+            other = self.typing(other)  # see comments in .__add__()
+            if other == 1:
+                return self
+            # numpy would only warn and return infinite entries.
+            elif other == 0:
+                raise ZeroDivisionError("division by zero")
+            return self._from_raw(self._entries / other)
         return NotImplemented
 
     def __eq__(self, other):
@@ -199,10 +315,7 @@ class Vector:
         if isinstance(other, self.__class__):
             if len(self) != len(other):
                 raise ValueError("vectors must be of the same length")
-            for x, y in zip(self, other):
-                if abs(x - y) > self.zero_threshold:
-                    return False  # exit early if two corresponding entries differ
-            return True
+            return utils.all_close(self._entries, other._entries, self.zero_threshold)
         return NotImplemented
 
     def __pos__(self):
@@ -217,7 +330,7 @@ class Vector:
 
         Negate all entries of a Vector.
         """
-        return self.__class__(-x for x in self)
+        return self._from_raw(-self._entries)
 
     def __abs__(self):
         """The Euclidean norm of a vector."""
@@ -257,6 +370,9 @@ class Vector:
             >>> v.as_matrix(column=False)
             Matrix(((1.0, 2.0, 3.0,)))
         """
+        # numpy only reshapes the one-dimensional array of entries into a
+        # two-dimensional one instead of re-wrapping every entry one by one.
+        entries = self._entries.astype(self.matrix_cls.typing, copy=False)
         if column:
-            return self.matrix_cls([x] for x in self)
-        return self.matrix_cls([(x for x in self)])
+            return self.matrix_cls._from_raw(entries.reshape(-1, 1))
+        return self.matrix_cls._from_raw(entries.reshape(1, -1))
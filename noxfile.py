@@ -2,7 +2,7 @@
 
 Nox provides the following tasks:
 
-- "init-project": install the pre-commit hooks
+- "init-project": install the pre-commit hooks and pre-compile the sources
 
 - "doctests": run the xdoctests in the source files
 
@@ -11,12 +11,13 @@ Nox provides the following tasks:
 
 """
 
-import contextlib
+import fnmatch
 import glob
 import os
 import re
 import shutil
 import subprocess
+import sys
 import tempfile
 
 import nox
@@ -29,9 +30,31 @@ SRC_LOCATIONS = (
     "11_classes/sample_package",
 )
 
+# Links to resources on github.com, nbviewer.jupyter.org, or mybinder.org
+# that contain git branch labels. Each alternative captures the part of a link
+# in front of the branch label in a named group. The label itself is followed
+# by either a "/" (github and nbviewer) or a "?" (mybinder).
+BRANCH_REFERENCE = re.compile(
+    "|".join(
+        (
+            fr"(?P<github>https?://github\.com/{REPOSITORY}/(?:blob|tree)/)[\w-]+/",
+            fr"(?P<nbviewer>https?://nbviewer\.jupyter\.org/github/{REPOSITORY}/(?:blob|tree)/)[\w-]+/",
+            fr"(?P<mybinder>https?://mybinder\.org/v2/gh/{REPOSITORY}/)[\w-]+\?",
+        )
+    )
+)
+
+# Folders that are not searched for files with branch references: hidden ones
+# (e.g., .cache/ or .git/) and other ones ignored by git (e.g., venv/).
+SKIPPED_FOLDERS = (".*", "__pycache__", "*.egg-info", "node_modules", "venv")
+
 # Use a unified .cache/ folder for all develop tools.
 nox.options.envdir = ".cache/nox"
 
+# The "fix-branch-references" task remembers the branch label it last wrote,
+# the number of re-written files, and their newest change time in this file.
+LAST_BRANCH_CACHE = os.path.join(nox.options.envdir, "last-branch")
+
 # All tools except git and poetry are project dependencies.
 # Avoid accidental successes if the environment is not set up properly.
 nox.options.error_on_external_run = True
@@ -39,28 +62,34 @@ nox.options.error_on_external_run = True
 
 @nox.session(name="init-project", venv_backend="none")
 def init_project(session):
-    """Install the pre-commit hooks."""
-    for type_ in (
+    """Install the pre-commit hooks and pre-compile the sources."""
+    # pre-commit accepts several hook types in one invocation.
+    _poetry_run(
+        session,
         "pre-commit",
-        "pre-merge-commit",
-    ):
-        session.run("poetry", "run", "pre-commit", "install", f"--hook-type={type_}")
+        "install",
+        "--hook-type=pre-commit",
+        "--hook-type=pre-merge-commit",
+    )
 
     # Copy the extensions' JavaScript and CSS files into Jupyter's search directory.
-    session.run(
-        "poetry", "run", "jupyter", "contrib", "nbextension", "install", "--user"
-    )
+    _poetry_run(session, "jupyter", "contrib", "nbextension", "install", "--user")
+
+    # Write the byte code of the sources checked by the "doctests" task into the
+    # __pycache__/ folders. Later imports only re-compile the changed modules.
+    _poetry_run(session, "python", "-m", "compileall", "-q", *SRC_LOCATIONS)
 
 
 @nox.session(venv_backend="none")
 def doctests(session):
     """Run the xdoctests in the source files."""
+    # xdoctest only accepts one module or package per invocation.
     for location in SRC_LOCATIONS:
-        session.run("poetry", "run", "xdoctest", "--silent", location)
+        _poetry_run(session, "xdoctest", "--silent", location)
 
 
 @nox.session(name="fix-branch-references", venv_backend="none")
-def fix_branch_references(_session):
+def fix_branch_references(session):
     """Change git branch references.
 
     Intended to be run as a pre-commit hook.
@@ -70,17 +99,18 @@ def fix_branch_references(_session):
     labels.
 
     This task rewrites branch labels into either "main" or "develop".
+
+    If neither the branch label nor any of the files changed since the last
+    run, the files are not read at all.
+
+    If files are passed in as positional arguments (e.g., the staged files
+    passed in by pre-commit after the "--" in the hook's entry), only these
+    are re-written.
     """
     # Glob patterns that expand into the files whose links are re-written.
     paths = ["*.md", "**/*.ipynb"]
 
-    branch = (
-        subprocess.check_output(
-            ("git", "rev-parse", "--abbrev-ref", "HEAD"),
-        )
-        .decode()
-        .strip()
-    )
+    branch = _current_branch()
     # If the current branch is only temporary and will be merged into "main", ...
     if branch.startswith("release-") or branch.startswith("hotfix-"):
         branch = "main"
@@ -88,41 +118,97 @@ def fix_branch_references(_session):
     elif branch != "main":
         branch = "develop"
 
-    rewrites = [
-        {
-            "name": "github",
-            "pattern": re.compile(
-                fr"((((http)|(https))://github\.com/{REPOSITORY}/((blob)|(tree))/)([\w-]+)/)"
-            ),
-            "replacement": fr"\2{branch}/",
-        },
-        {
-            "name": "nbviewer",
-            "pattern": re.compile(
-                fr"((((http)|(https))://nbviewer\.jupyter\.org/github/{REPOSITORY}/((blob)|(tree))/)([\w-]+)/)",
-            ),
-            "replacement": fr"\2{branch}/",
-        },
-        {
-            "name": "mybinder",
-            "pattern": re.compile(
-                fr"((((http)|(https))://mybinder\.org/v2/gh/{REPOSITORY}/)([\w-]+)\?)",
-            ),
-            "replacement": fr"\2{branch}?",
-        },
-    ]
-
+    def rewrite(match):
+        """Replace the branch label in a link matched by BRANCH_REFERENCE."""
+        # The name of the (only) matched group tells the kind of link.
+        suffix = "?" if match.lastgroup == "mybinder" else "/"
+        return match.group(match.lastgroup) + branch + suffix
+
+    # pre-commit already filters the staged files with the hook's `files` pattern.
+    # The files are re-written regardless of the cache below as it is only
+    # valid for all files together.
+    if session.posargs:
+        for path in session.posargs:
+            if path.endswith((".md", ".ipynb")):
+                _replace_in_file(path, BRANCH_REFERENCE, rewrite)
+        return
+
+    # In the common case of a pre-commit hook run with nothing to do,
+    # looking at the files' metadata suffices.
+    n_files, newest_change = _files_state(_expand(*paths))
+    if _read_last_branch() == (branch, n_files, newest_change):
+        return
+
+    # One pass over every file's contents as a whole with the combined
+    # pattern instead of one pass per line and kind of link.
+    changed = False
     for expanded in _expand(*paths):
-        with _line_by_line_replace(expanded) as (old_file, new_file):
-            for line in old_file:
-                for rewrite in rewrites:
-                    line = re.sub(rewrite["pattern"], rewrite["replacement"], line)
-                new_file.write(line)
+        changed |= _replace_in_file(expanded, BRANCH_REFERENCE, rewrite)
+
+    # Re-written files have a new change time.
+    if changed:
+        n_files, newest_change = _files_state(_expand(*paths))
+    _write_last_branch(branch, n_files, newest_change)
+
+
+def _poetry_run(session, *args):
+    """Run a command within the project's virtual environment.
+
+    If nox itself already runs within that environment (e.g., it is started with
+    `poetry run nox` as in the pre-commit hooks or from within `poetry shell`),
+    the command is run directly. That saves poetry from resolving the
+    environment once more for every command.
+
+    Args:
+        session: the nox session to run the command in
+        *args: the command and its arguments
+    """
+    if os.environ.get("POETRY_ACTIVE") or os.environ.get("VIRTUAL_ENV") == sys.prefix:
+        session.run(*args)
+    else:
+        session.run("poetry", "run", *args)
+
+
+def _current_branch():
+    """Obtain the name of the currently checked out git branch.
+
+    Reading .git/HEAD directly is a lot faster than starting a git process.
+    Only if .git is not a folder (e.g., in a worktree or a submodule), git is
+    asked instead.
+
+    Returns:
+        branch (str): "HEAD" if no branch is checked out (i.e., detached HEAD)
+    """
+    try:
+        with open(os.path.join(".git", "HEAD")) as file:
+            head = file.read().strip()
+    except OSError:
+        head = None
+
+    # A checked out branch is referenced as "ref: refs/heads/<branch>".
+    if head and head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/") :]
+    # Otherwise, HEAD contains a commit's SHA, for which
+    # `git rev-parse --abbrev-ref HEAD` also returns "HEAD".
+    elif head:
+        return "HEAD"
+
+    return (
+        subprocess.check_output(
+            ("git", "rev-parse", "--abbrev-ref", "HEAD"),
+        )
+        .decode()
+        .strip()
+    )
 
 
 def _expand(*patterns):
     """Expand glob patterns into paths.
 
+    A pattern starting with "**/" (e.g., "**/*.ipynb") matches files in the
+    project's root folder and all (sub-)folders, except for SKIPPED_FOLDERS.
+    Other patterns are expanded as usual with glob.
+
     Args:
         *patterns: the patterns to be expanded
 
@@ -130,30 +216,98 @@ def _expand(*patterns):
         path: a single expanded path
     """
     for pattern in patterns:
-        yield from glob.glob(pattern.strip())
+        pattern = pattern.strip()
+        if not pattern.startswith("**/"):
+            yield from glob.iglob(pattern)
+            continue
+
+        for root, folders, files in os.walk("."):
+            # Pruning the folders in place keeps os.walk() from descending
+            # into them at all, in particular into large ones like venv/.
+            folders[:] = [
+                folder
+                for folder in folders
+                if not any(fnmatch.fnmatch(folder, skip) for skip in SKIPPED_FOLDERS)
+            ]
+            for file in fnmatch.filter(files, pattern[3:]):
+                yield os.path.normpath(os.path.join(root, file))
+
+
+def _files_state(paths):
+    """Obtain the number of some files and their newest change time.
+
+    A file's modification time may be set back (e.g., by `cp -p` or
+    `touch -d`). Its status change time (ctime) cannot, but it is updated
+    whenever the file is written or its metadata, including the modification
+    time, is changed. The number of files covers deleted files.
 
+    Args:
+        paths (iterable): the files' paths
 
-@contextlib.contextmanager
-def _line_by_line_replace(path):
-    """Replace/change the lines in a file one by one.
+    Returns:
+        n_files, newest_change (tuple): newest_change is 0.0 if there are no files
+    """
+    n_files, newest_change = 0, 0.0
+    for path in paths:
+        stat = os.stat(path)
+        n_files += 1
+        newest_change = max(newest_change, stat.st_mtime, stat.st_ctime)
+    return n_files, newest_change
 
-    This generator function yields two file handles, one to the current file
-    (i.e., `old_file`) and one to its replacement (i.e., `new_file`).
 
-    Usage: loop over the lines in `old_file` and write the files to be kept
-    to `new_file`. Files not written to `new_file` are removed!
+def _read_last_branch():
+    """Read the branch label and files' state cached by the last run.
+
+    Returns:
+        branch, n_files, newest_change (tuple): None if there is no (valid) cache
+    """
+    try:
+        with open(LAST_BRANCH_CACHE) as file:
+            branch, n_files, newest_change = file.read().split()
+        return branch, int(n_files), float(newest_change)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_last_branch(branch, n_files, newest_change):
+    """Cache the branch label and files' state for the next run.
 
     Args:
-        path: the file whose lines are to be replaced
+        branch (str): the branch label written into the files
+        n_files (int): the number of files
+        newest_change (float): the newest change time of the files
+    """
+    os.makedirs(os.path.dirname(LAST_BRANCH_CACHE), exist_ok=True)
+    with open(LAST_BRANCH_CACHE, "w") as file:
+        # repr() preserves the float's precision for the exact comparison.
+        file.write(f"{branch} {n_files:d} {newest_change!r}\n")
 
-    Yields:
-        old_file, new_file: handles to a file and its replacement
+
+def _replace_in_file(path, pattern, repl):
+    """Replace all matches of a regular expression in a file.
+
+    The file is only re-written if anything changes. Then, the new contents
+    are written to a temporary file in the same folder, which atomically
+    replaces the old file.
+
+    Args:
+        path: the file whose contents are to be replaced
+        pattern (re.Pattern): the regular expression to be replaced
+        repl (str / callable): the replacement passed on to `pattern.sub()`
+
+    Returns:
+        changed (bool): if the file was re-written
     """
-    file_handle, new_file_path = tempfile.mkstemp()
+    with open(path) as old_file:
+        old_contents = old_file.read()
+    new_contents = pattern.sub(repl, old_contents)
+    if new_contents == old_contents:
+        return False
+
+    file_handle, new_file_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".")
     with os.fdopen(file_handle, "w") as new_file:
-        with open(path) as old_file:
-            yield old_file, new_file
+        new_file.write(new_contents)
 
     shutil.copymode(path, new_file_path)
-    os.remove(path)
-    shutil.move(new_file_path, path)
+    os.replace(new_file_path, path)
+    return True